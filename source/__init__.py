@@ -12,17 +12,33 @@ __date__ = '11 December 2017'
 __version__ = 2, 6, 1
 __all__ = ['QuizMe', 'MutableBool']
 
+import concurrent.futures
+import contextlib
+import io
 import pathlib
-import test.support
+import threading
 import time
 import tkinter
-import tkinter.filedialog
 import tkinter.messagebox
 import traceback
-import xml.sax
+import xml.etree.ElementTree
+import xml.parsers.expat
 
 from . import exe_queue, gui_logs, splash, teach_me, testbank
 
+_EXHAUSTED = object()
+
+
+def _load_engine(future, path):
+    """Parse the testbank at path and set a quiz engine built from it."""
+    if future.set_running_or_notify_cancel():
+        try:
+            engine = teach_me.FAQ(testbank.BankParser.parse(path))
+        except BaseException as error:
+            future.set_exception(error)
+        else:
+            future.set_result(engine)
+
 
 class QuizMe(tkinter.Frame):
     """QuizMe(master) -> QuizMe instance"""
@@ -32,12 +48,14 @@ class QuizMe(tkinter.Frame):
     @classmethod
     def main(cls):
         """Provide the primary entry point for running QuizMe."""
-        with test.support.captured_output('stderr') as stderr:
+        with contextlib.redirect_stderr(io.StringIO()) as stderr:
             # noinspection PyPep8,PyBroadException
             try:
                 tkinter.NoDefaultRoot()
                 root = tkinter.Tk()
-                with splash.Splash(root, 'images/QuizMe Logo.gif', 3):
+                with splash.Splash(
+                        root, 'images/QuizMe Logo.gif', 3, minimum=True
+                ):
                     # Set up the root window.
                     root.title('QuizMe 2.5')
                     root.resizable(False, False)
@@ -45,23 +63,18 @@ class QuizMe(tkinter.Frame):
                     # Create the program GUI.
                     application = cls(root)
                     application.grid()
-                cls.alternate_mainloop(root, 1 << 6)
+                cls.alternate_mainloop(root)
             except:
                 traceback.print_exc()
         cls.cleanup(stderr)
 
     @staticmethod
-    def alternate_mainloop(root, fps):
+    def alternate_mainloop(root, poll_ms=10):
         """Try to experimentally support threads."""
-        deferred_root = exe_queue.Pipe(root)
+        deferred_root = exe_queue.Pipe(root, poll_ms)
         gui_logs.set_application_root(deferred_root)
-        while True:
-            try:
-                root.update()
-            except tkinter.TclError:
-                break
-            time.sleep(1 / fps)
-            deferred_root.update()
+        root.after_idle(deferred_root._drain)
+        root.mainloop()
 
     @staticmethod
     def cleanup(stream):
@@ -97,7 +110,7 @@ class QuizMe(tkinter.Frame):
         self.enter.grid(row=2, column=0, **options)
         self.done = False
         self.last_exit = ''
-        self.next_event = iter(()).__next__
+        self.events = iter(())
 
     @staticmethod
     def select_all(event):
@@ -107,6 +120,7 @@ class QuizMe(tkinter.Frame):
 
     def file(self):
         """Display file chooser and update the entry box appropriately."""
+        import tkinter.filedialog
         filename = tkinter.filedialog.askopenfilename(
             defaultextension='.xml',
             filetypes=[('XML', '.xml'), ('All', '*')],
@@ -123,30 +137,13 @@ class QuizMe(tkinter.Frame):
         path = pathlib.Path(self.entry.get())
         if path.exists():
             if path.is_file():
-                # noinspection PyPep8,PyBroadException
-                try:
-                    bank = testbank.BankParser.parse(str(path))
-                    engine = teach_me.FAQ(bank)
-                except xml.sax.SAXParseException as error:
-                    tkinter.messagebox.showerror(
-                        error.getMessage().title(),
-                        f'Line {error.getLineNumber()}, '
-                        f'Column {error.getColumnNumber()}',
-                        master=self
-                    )
-                except RuntimeError as error:
-                    tkinter.messagebox.showerror(
-                        'Validation Error', error.args[0], master=self
-                    )
-                except:
-                    tkinter.messagebox.showerror(
-                        'Error', 'Unknown exception was thrown!', master=self
-                    )
-                    raise
-                else:
-                    self.done = False
-                    self.next_event = iter(engine).__next__
-                    self.after_idle(self.execute_quiz)
+                self.enter['state'] = tkinter.DISABLED
+                future = concurrent.futures.Future()
+                future.add_done_callback(self.parse_done)
+                # A daemon thread lets the program exit while still loading.
+                threading.Thread(
+                    target=_load_engine, args=(future, str(path)), daemon=True
+                ).start()
             else:
                 tkinter.messagebox.showwarning(
                     'Warning', 'File does not exist.', master=self
@@ -156,39 +153,93 @@ class QuizMe(tkinter.Frame):
                 'Information', 'Path does not exist.', master=self
             )
 
+    def parse_done(self, future):
+        """Pass the outcome of loading a testbank back to the GUI thread."""
+        root = gui_logs.get_application_root()
+        error = future.exception()
+        if error is None:
+            root.after_idle(self.parse_finished, future.result())
+        else:
+            root.after_idle(self.parse_failed, error)
+
+    def parse_failed(self, error):
+        """Show the user why the testbank could not be loaded."""
+        self.enter['state'] = tkinter.NORMAL
+        if isinstance(error, xml.etree.ElementTree.ParseError):
+            line, column = error.position
+            tkinter.messagebox.showerror(
+                xml.parsers.expat.ErrorString(error.code).title(),
+                f'Line {line}, Column {column}',
+                master=self
+            )
+        elif isinstance(error, RuntimeError):
+            tkinter.messagebox.showerror(
+                'Validation Error', error.args[0], master=self
+            )
+        else:
+            tkinter.messagebox.showerror(
+                'Error', 'Unknown exception was thrown!', master=self
+            )
+            raise error
+
+    def parse_finished(self, engine):
+        """Begin the quiz now that the testbank has been loaded."""
+        self.enter['state'] = tkinter.NORMAL
+        self.done = False
+        self.events = iter(engine)
+        self.after_idle(self.execute_quiz)
+
     def execute_quiz(self):
         """Handle each event generated by the quiz engine with dialogs."""
-        try:
-            event = self.next_event()
-        except StopIteration:
+        event = next(self.events, _EXHAUSTED)
+        if event is _EXHAUSTED:
             if not self.done:
                 raise RuntimeError('Final event not processed!')
         else:
-            if isinstance(event, teach_me.Enter):
-                gui_logs.ShowStatus(self, 'Entering', event, self.execute_quiz)
-            elif isinstance(event, teach_me.Exit):
-                gui_logs.ShowStatus(self, 'Exiting', event, self.execute_quiz)
-                self.last_exit = event.kind
-            elif isinstance(event, teach_me.Question):
-                gui_logs.AskQuestion(self, event, self.execute_quiz)
-            elif isinstance(event, teach_me.Report):
-                continue_after_review = MutableBool(True)
-                if self.last_exit == 'Section' and event.wrong:
-                    continue_after_review.value = False
-                    gui_logs.ReviewProblems(self, event, continue_after_review)
-                if continue_after_review.value:
-                    gui_logs.ShowReport(self, event, self.execute_quiz)
-                if event.final:
-                    tkinter.messagebox.showinfo(
-                        'Congratulations!',
-                        'You have finished the test.',
-                        master=self
-                    )
-                    self.done = True
-            else:
+            handler = self.EVENT_HANDLERS.get(type(event))
+            if handler is None:
                 tkinter.messagebox.showerror(
                     'Type Error', repr(event), master=self
                 )
+            else:
+                handler(self, event)
+
+    def enter_event(self, event):
+        """Show the user which part of the test is being entered."""
+        gui_logs.ShowStatus(self, 'Entering', event, self.execute_quiz)
+
+    def exit_event(self, event):
+        """Show the user which part of the test is being exited."""
+        gui_logs.ShowStatus(self, 'Exiting', event, self.execute_quiz)
+        self.last_exit = event.kind
+
+    def question_event(self, event):
+        """Ask the user the question that the event represents."""
+        gui_logs.AskQuestion(self, event, self.execute_quiz)
+
+    def report_event(self, event):
+        """Review any problems and show the user how well they did."""
+        continue_after_review = MutableBool(True)
+        if self.last_exit == 'Section' and event.wrong:
+            continue_after_review.value = False
+            gui_logs.ReviewProblems(self, event, continue_after_review)
+        if continue_after_review.value:
+            gui_logs.ShowReport(self, event, self.execute_quiz)
+        if event.final:
+            tkinter.messagebox.showinfo(
+                'Congratulations!',
+                'You have finished the test.',
+                master=self
+            )
+            self.done = True
+
+    # Map each type of event from the quiz engine to the method handling it.
+    EVENT_HANDLERS = {
+        teach_me.Enter: enter_event,
+        teach_me.Exit: exit_event,
+        teach_me.Question: question_event,
+        teach_me.Report: report_event
+    }
 
 
 # noinspection PyAttributeOutsideInit
@@ -10,21 +10,28 @@ __author__ = 'Stephen "Zero" Chappell ' \
              '<stephen.paul.chappell@atlantis-zero.net>'
 __date__ = '11 December 2017'
 __version__ = 2, 6, 1
-__all__ = ['Pipe', 'DeferredCall']
+__all__ = ['Pipe']
 
 import collections
-import queue
 
 
 class Pipe:
-    """Pipe(obj) -> Pipe instance"""
+    """Pipe(obj, poll_ms=10) -> Pipe instance"""
 
-    __slots__ = '__obj', '__queue', '__dict__'
+    __slots__ = '__obj', '__queue', '__poll_ms', '__methods', '__dict__'
 
-    def __init__(self, obj):
+    # Methods the application calls through the pipe, created ahead of time
+    # so the first call skips __getattr__; any others are made on first use.
+    _HOT_METHODS = ('after_idle',)
+
+    def __init__(self, obj, poll_ms=10):
         """Initialize Pipe object so it can capture method calls."""
         self.__obj = obj
-        self.__queue = queue.Queue()
+        self.__queue = collections.deque()
+        self.__poll_ms = poll_ms
+        self.__methods = {}
+        for name in self._HOT_METHODS:
+            setattr(self, name, _Method(self.__queue, name))
 
     def __getattr__(self, name):
         """Generate methods on the fly and cache the results."""
@@ -34,25 +41,33 @@ class Pipe:
 
     def update(self):
         """Execute all methods calls since update was last ran."""
-        while not self.__queue.empty():
-            name, args, kwargs = self.__queue.get()
-            getattr(self.__obj, name)(*args, **kwargs)
-
-
-# Create class that stores all the details to run a function or method later.
-DeferredCall = collections.namedtuple('DeferredCall', 'method, args, kwargs')
+        todo, methods = self.__queue, self.__methods
+        while todo:
+            name, args, kwargs = todo.popleft()
+            method = methods.get(name)
+            if method is None:
+                method = methods[name] = getattr(self.__obj, name)
+            method(*args, **kwargs)
+
+    def _drain(self):
+        """Run the pending method calls and schedule the next drain."""
+        try:
+            self.update()
+        finally:
+            # Calls queued behind a failed one are run on the next drain.
+            self.__obj.after(self.__poll_ms, self._drain)
 
 
 class _Method:
-    """_Method(todo) -> _Method instance"""
+    """_Method(todo, name) -> _Method instance"""
 
-    __slots__ = '__todo', '__name'
+    __slots__ = '__append', '__name'
 
     def __init__(self, todo, name):
         """Initialize the virtual method so calls can be recorded."""
-        self.__todo = todo
+        self.__append = todo.append
         self.__name = name
 
     def __call__(self, *args, **kwargs):
         """Record the call so that it may be executed later on."""
-        self.__todo.put(DeferredCall(self.__name, args, kwargs))
+        self.__append((self.__name, args, kwargs))
@@ -80,6 +80,11 @@ class _Dialog(tkinter.simpledialog.Dialog, metaclass=abc.ABCMeta):
             self.destroy()
 
 
+# Share the text wrappers between dialogs instead of making one per call.
+_WRAP_FULL = textwrap.TextWrapper(_Dialog.TEXT_WIDTH)
+_WRAP_HALF = textwrap.TextWrapper(_Dialog.TEXT_WIDTH >> 1)
+
+
 # noinspection PyAttributeOutsideInit
 class ShowStatus(_Dialog):
     """ShowStatus(parent, title, message, callback) -> ShowStatus instance"""
@@ -115,7 +120,7 @@ class AskQuestion(_Dialog):
 
     def __init__(self, parent, event, callback):
         """Initialize the dialog with information taken from the event."""
-        self.question = textwrap.wrap(event.question, self.TEXT_WIDTH)
+        self.question = _WRAP_FULL.wrap(event.question)
         self.choices = event.choices
         self.give_answer = event.answer
         self.callback = callback
@@ -135,7 +140,7 @@ class AskQuestion(_Dialog):
         for choice in self.choices:
             self.buttons.append(tkinter.Button(
                 box,
-                text=textwrap.fill(choice, self.TEXT_WIDTH),
+                text=_WRAP_FULL.fill(choice),
                 width=self.TEXT_WIDTH,
                 command=functools.partial(self.click, choice)
             ))
@@ -158,7 +163,12 @@ class ReviewProblems(_Dialog):
 
     def __init__(self, parent, event, continue_after_review):
         """Initialize the report with problems generated by the event."""
-        self.problems = list(event.get_problems())
+        self.problems = [(
+            problem.category,
+            _WRAP_FULL.fill(problem.question),
+            _WRAP_HALF.fill(problem.answer),
+            _WRAP_HALF.fill(problem.right)
+        ) for problem in event.get_problems()]
         self.problem = 0
         self.continue_after_review = continue_after_review
         super().__init__(parent, 'Problems')
@@ -224,11 +234,11 @@ class ReviewProblems(_Dialog):
     def update(self):
         """Update the labels and button states based the review's state."""
         p_index, p_array = self.problem, self.problems
-        problem = p_array[p_index]
-        self.category.set(problem.category)
-        self.question.set(textwrap.fill(problem.question, self.TEXT_WIDTH))
-        self.answer.set(textwrap.fill(problem.answer, self.TEXT_WIDTH >> 1))
-        self.right.set(textwrap.fill(problem.right, self.TEXT_WIDTH >> 1))
+        category, question, answer, right = p_array[p_index]
+        self.category.set(category)
+        self.question.set(question)
+        self.answer.set(answer)
+        self.right.set(right)
         # Update the buttons.
         self.back['state'] = NORMAL if p_index > 0 else DISABLED
         self.next['state'] = NORMAL if p_index + 1 < len(p_array) else DISABLED
@@ -259,12 +269,11 @@ class ShowReport(_Dialog):
         legend = {'anchor': W,
                   'justify': LEFT,
                   'font': tkinter.font.Font(self, weight='bold')}
+        rule = self.RULE * self.TEXT_WIDTH
         # Create all labels.
         text = f'Cumulative score for\nprevious {self.level}:'
         self.explanation = tkinter.Label(master, text=text, font=title)
-        self.ruler_one = tkinter.Label(
-            master, text=self.RULE * self.TEXT_WIDTH
-        )
+        self.ruler_one = tkinter.Label(master, text=rule)
         self.answers_right = tkinter.Label(
             master, text='Answers right:', **legend
         )
@@ -278,9 +287,7 @@ class ShowReport(_Dialog):
         )
         percentage = str(int(100 * self.right / self.total + 0.5)) + '%'
         self.display = tkinter.Label(master, text=percentage)
-        self.ruler_two = tkinter.Label(
-            master, text=self.RULE * self.TEXT_WIDTH
-        )
+        self.ruler_two = tkinter.Label(master, text=rule)
         # Display the results.
         options = dict(sticky=NSEW, padx=5, pady=5)
         self.explanation.grid(row=0, column=0, columnspan=2, **options)
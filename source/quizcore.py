@@ -26,6 +26,7 @@ __all__ = [
 import abc
 import collections
 import random
+import sys
 
 from . import testbank
 
@@ -35,6 +36,8 @@ class UnitTest:
 
     __slots__ = 'name', 'chapters'
 
+    KIND = 'UnitTest'
+
     def __init__(self, root_node):
         """Initialize the UnitTest instance and validate its data."""
         self.name = root_node.attr
@@ -48,6 +51,8 @@ class Chapter:
 
     __slots__ = 'name', 'sections'
 
+    KIND = 'Chapter'
+
     def __init__(self, chapter):
         """Initialize the Chapter instance and validate its data."""
         self.name = chapter.attr
@@ -61,6 +66,8 @@ class Section:
 
     __slots__ = 'name', 'categories'
 
+    KIND = 'Section'
+
     def __init__(self, section):
         """Initialize the Section instance and validate its data."""
         self.name = section.attr
@@ -84,7 +91,7 @@ Record = collections.namedtuple('Record', 'kind, question, choices, answer')
 class _Category(metaclass=abc.ABCMeta):
     """Abstract Base Class"""
 
-    __slots__ = 'facts', 'q_and_a'
+    __slots__ = 'facts', 'rng'
 
     CHOICES = 0
     NAME = ''
@@ -96,11 +103,11 @@ class _Category(metaclass=abc.ABCMeta):
                       for child in category.children]
         if not self.facts:
             raise RuntimeError('Category is empty!')
-        self.q_and_a = []
+        self.rng = random.Random()
 
     @abc.abstractmethod
     def build(self):
-        """Construct the table of questions and answers."""
+        """Construct and return the table of questions and answers."""
         pass
 
 
@@ -115,30 +122,41 @@ class _MCM(_Category):
         super().__init__(category)
 
     def build(self):
-        """Construct the table of questions and answers."""
-        kinds = {}
+        """Construct and return the table of questions and answers."""
+        q_and_a = []
+        by_kind = {}
         for fact in self.facts:
             fact.build()
-            for question in fact.q_to_a:
-                kinds.setdefault(fact.kind, {'question': {}, 'answer': {}})[
-                    'question'].setdefault(question, set()).update(
-                    fact.q_to_a[question])
-            for answer in fact.a_to_q:
-                kinds.setdefault(fact.kind, {'question': {}, 'answer': {}})[
-                    'answer'].setdefault(answer, set()).update(
-                    fact.a_to_q[answer])
-        for kind in kinds:
-            questions = set(kinds[kind]['question'])
-            answers = set(kinds[kind]['answer'])
-            for question in questions:
-                wrong = answers.difference(kinds[kind]['question'][question])
-                sample = random.sample(wrong, min(len(wrong), self.CHOICES))
-                right = random.choice(tuple(kinds[kind]['question'][question]))
-                sample.append(right)
-                random.shuffle(sample)
-                self.q_and_a.append(Record(
+            tables = by_kind.get(fact.kind)
+            if tables is None:
+                tables = by_kind[fact.kind] = {}, {}
+            q_dict, a_dict = tables
+            for question, answers in fact.q_to_a.items():
+                union = q_dict.get(question)
+                if union is None:
+                    q_dict[question] = union = set()
+                union |= answers
+            for answer, questions in fact.a_to_q.items():
+                union = a_dict.get(answer)
+                if union is None:
+                    a_dict[answer] = union = set()
+                union |= questions
+        for q_dict, a_dict in by_kind.values():
+            answers = tuple(a_dict)
+            for question, rights in q_dict.items():
+                wrong = [answer for answer in answers if answer not in rights]
+                count = min(len(wrong), self.CHOICES)
+                sample = self.rng.sample(wrong, count)
+                right = (
+                    next(iter(rights)) if len(rights) == 1 else
+                    self.rng.choice(tuple(rights))
+                )
+                # The sample is already in random order, so only place right.
+                sample.insert(self.rng.randrange(count + 1), right)
+                q_and_a.append(Record(
                     self.NAME, question, tuple(sample), right
                 ))
+        return q_and_a
 
 
 class Matching(_MCM):
@@ -177,7 +195,8 @@ class TrueOrFalse(_Category):
         super().__init__(category)
 
     def build(self):
-        """Construct the table of questions and answers."""
+        """Construct and return the table of questions and answers."""
+        q_and_a = []
         questions = {}
         for fact in self.facts:
             fact.build()
@@ -188,11 +207,12 @@ class TrueOrFalse(_Category):
         for question in questions:
             if len(questions[question]) != 1:
                 raise RuntimeError('Question is invalid!')
-            sample = random.sample(('True', 'False'), 2)
-            right = tuple(questions[question])[0]
-            self.q_and_a.append(Record(
+            sample = self.rng.sample(('True', 'False'), 2)
+            right = next(iter(questions[question]))
+            q_and_a.append(Record(
                 'True or False', question, tuple(sample), right
             ))
+        return q_and_a
 
 
 _CATEGORY = dict(
@@ -209,27 +229,30 @@ class Fact:
 
     def __init__(self, fact, true_or_false):
         """Initialize the Fact instance and sort the questions and answers."""
-        self.kind = fact.attr
+        # Only facts in multiple choice categories are given a kind.
+        self.kind = None if fact.attr is None else sys.intern(fact.attr)
         self.questions = []
         self.answers = []
+        add_question = self.questions.append
+        add_answer = self.answers.append
         for child in fact.children:
-            if isinstance(child, testbank.Question):
-                self.questions.append(Question(child))
-            elif isinstance(child, testbank.Answer):
-                self.answers.append(Answer(child, true_or_false))
+            # The node types are never subclassed, so identity is enough.
+            kind = type(child)
+            if kind is testbank.Question:
+                add_question(Question(child))
+            elif kind is testbank.Answer:
+                add_answer(Answer(child, true_or_false))
             else:
                 raise TypeError(child)
         if not self.answers:
             raise RuntimeError('Fact is empty!')
-        self.q_to_a = {}
-        self.a_to_q = {}
 
     def build(self):
         """Construct the mappings for questions and answers."""
         questions = frozenset(question.text for question in self.questions)
         answers = frozenset(answer.text for answer in self.answers)
-        self.q_to_a.update((question, answers) for question in questions)
-        self.a_to_q.update((answer, questions) for answer in answers)
+        self.q_to_a = dict.fromkeys(questions, answers)
+        self.a_to_q = dict.fromkeys(answers, questions)
 
 
 class Question:
@@ -239,7 +262,7 @@ class Question:
 
     def __init__(self, question):
         """Initialize the Question instance with the question's text."""
-        self.text = question.text
+        self.text = sys.intern(question.text)
 
 
 class Answer:
@@ -251,4 +274,4 @@ class Answer:
         """Initialize the Answer instance and validate if needed."""
         if true_or_false and answer.text not in {'True', 'False'}:
             raise RuntimeError('Answer is invalid!')
-        self.text = answer.text
+        self.text = sys.intern(answer.text)
@@ -12,22 +12,27 @@ __date__ = '11 December 2017'
 __version__ = 2, 6, 1
 __all__ = ['Splash']
 
+import base64
 import time
 import tkinter
 
 
 class Splash:
-    """Splash(root, file, wait) -> Splash instance"""
+    """Splash(root, file, wait, minimum=False) -> Splash instance"""
 
     __slots__ = (
-        '__root', '__file', '__wait', '__window', '__canvas', '__splash'
+        '__root', '__data', '__wait', '__minimum', '__window', '__canvas',
+        '__splash'
     )
 
-    def __init__(self, root, file, wait):
+    def __init__(self, root, file, wait, minimum=False):
         """Initialize the Splash instance so it knows what to display."""
         self.__root = root
-        self.__file = file
-        self.__wait = wait + time.clock()
+        # Read the image now so that showing it does not wait on the disk.
+        with open(file, 'rb') as image:
+            self.__data = base64.b64encode(image.read())
+        self.__wait = wait + time.monotonic()
+        self.__minimum = minimum
 
     def __enter__(self):
         """Display the splash screen on the display while the GUI is built."""
@@ -36,7 +41,7 @@ class Splash:
         # Create components of splash screen.
         window = tkinter.Toplevel(self.__root)
         canvas = tkinter.Canvas(window)
-        splash = tkinter.PhotoImage(master=window, file=self.__file)
+        splash = tkinter.PhotoImage(master=window, data=self.__data)
         # Get the screen's width and height.
         scr_w = window.winfo_screenwidth()
         scr_h = window.winfo_screenheight()
@@ -51,7 +56,7 @@ class Splash:
         canvas.grid()
         # Show the splash screen on the monitor.
         canvas.create_image(img_w >> 1, img_h >> 1, image=splash)
-        window.update()
+        window.update_idletasks()
         # Save the variables for later cleanup.
         self.__window = window
         self.__canvas = canvas
@@ -59,10 +64,12 @@ class Splash:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Restore the splash screen's parent so that it can be seen."""
-        # Ensure that required time has passed.
-        now = time.clock()
-        if now < self.__wait:
-            time.sleep(self.__wait - now)
+        if self.__minimum:
+            # Ensure that required time has passed while Tk keeps painting.
+            remaining = max(0, int((self.__wait - time.monotonic()) * 1000))
+            done = tkinter.BooleanVar(self.__window, False)
+            self.__window.after(remaining, done.set, True)
+            self.__window.wait_variable(done)
         # Free used resources in reverse order.
         del self.__splash
         self.__canvas.destroy()
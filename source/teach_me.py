@@ -1,10 +1,11 @@
 #! /usr/bin/env python3
 """Events and event generator for a quizzing or testing session.
 
-The FAQ class is an iterator that takes a testbank and generates the events
-that control the flow of how quizzes and tests are taken. Reports are
-automatically generated along the way and keep track of the user's progress.
-The __init__ module is entirely dependent on this code to know what to do."""
+The FAQ class takes a testbank and builds the events that control the flow of
+how quizzes and tests are taken. Reports are automatically generated along the
+way and keep track of the user's progress, so each FAQ can only be iterated
+over once. The __init__ module is entirely dependent on this code to know what
+to do."""
 
 __author__ = 'Stephen "Zero" Chappell ' \
              '<stephen.paul.chappell@atlantis-zero.net>'
@@ -13,6 +14,7 @@ __version__ = 2, 6, 1
 __all__ = ['FAQ', 'Enter', 'Exit', 'Report', 'Question', 'Answer']
 
 import abc
+import itertools
 import random
 
 from . import quizcore
@@ -21,39 +23,57 @@ from . import quizcore
 class FAQ:
     """FAQ(testbank) -> FAQ instance"""
 
-    __slots__ = 'test'
+    __slots__ = 'test', 'events', '__started'
 
     def __init__(self, testbank):
         """Initialize the FAQ instance with a UnitTest it can use."""
         self.test = quizcore.UnitTest(testbank)
+        self.events = self.build_events()
+        self.__started = False
 
     def __iter__(self):
+        """Return an iterator over the one examination session allowed."""
+        if self.__started:
+            raise RuntimeError('Session has already been started!')
+        self.__started = True
+        return self.__run()
+
+    def __run(self):
         """Generate events that represent the examination session."""
+        for event in self.events:
+            # Reports can only be finished once their questions are answered.
+            if type(event) is Report:
+                event.finalize()
+            yield event
+
+    def __len__(self):
+        """Return how many events make up the examination session."""
+        return len(self.events)
+
+    def build_events(self):
+        """Create the list of events for the whole examination session."""
         unittest = self.test
-        yield Enter(unittest)
+        events = [Enter(unittest)]
         unittest_report = Report(unittest)
         for chapter in unittest.chapters:
-            yield Enter(chapter)
+            events.append(Enter(chapter))
             chapter_report = Report(chapter, unittest_report)
             for section in chapter.sections:
-                yield Enter(section)
+                events.append(Enter(section))
                 section_report = Report(section, chapter_report)
-                q_and_a = []
-                for category in section.categories:
-                    category.build()
-                    q_and_a.extend(category.q_and_a)
+                q_and_a = list(itertools.chain.from_iterable(
+                    category.build() for category in section.categories
+                ))
                 random.shuffle(q_and_a)
                 for question in q_and_a:
-                    yield Question(section_report, *question)
-                yield Exit(section)
-                section_report.finalize()
-                yield section_report
-            yield Exit(chapter)
-            chapter_report.finalize()
-            yield chapter_report
-        yield Exit(self.test)
-        unittest_report.finalize()
-        yield unittest_report
+                    events.append(Question(section_report, *question))
+                events.append(Exit(section))
+                events.append(section_report)
+            events.append(Exit(chapter))
+            events.append(chapter_report)
+        events.append(Exit(unittest))
+        events.append(unittest_report)
+        return events
 
 
 class _Status(metaclass=abc.ABCMeta):
@@ -64,7 +84,7 @@ class _Status(metaclass=abc.ABCMeta):
     @abc.abstractmethod
     def __init__(self, division):
         """Initialize the _Status instance with relevant event information."""
-        self.kind = type(division).__name__
+        self.kind = division.KIND
         self.name = division.name
 
     def __str__(self):
@@ -96,34 +116,36 @@ class Report:
     """Report(level, parent=None) -> Report instance"""
 
     __slots__ = (
-        '__level',
+        'level',
+        'right',
+        'wrong',
+        'total',
+        'final',
         '__parent',
-        '__right',
-        '__wrong',
         '__problems',
+        '__children',
         '__finalized'
     )
 
     def __init__(self, level, parent=None):
         """Initialize the Report instance so that it can track progress."""
-        self.__level = type(level).__name__
+        self.level = level.KIND
+        self.right = 0
+        self.wrong = 0
+        self.total = None  # The total is only known once finalized.
+        self.final = parent is None
         self.__parent = parent
-        self.__right = 0
-        self.__wrong = 0
         self.__problems = []
+        self.__children = []
         self.__finalized = False
 
     def right_answer(self):
         """Report that a question has been answered correctly."""
-        if self.__finalized:
-            raise RuntimeError('Report is finalized!')
-        self.__right += 1
+        self.right += 1
 
     def wrong_answer(self):
         """Report that a question has been answered incorrectly."""
-        if self.__finalized:
-            raise RuntimeError('Report is finalized!')
-        self.__wrong += 1
+        self.wrong += 1
 
     def review(self, question, answer):
         """Record a question and answer that will need to be reviewed."""
@@ -135,49 +157,23 @@ class Report:
         """Yield back answers that teach students what they got wrong."""
         if not self.__finalized:
             raise RuntimeError('Report is not finalized!')
-        for question, answer in self.__problems:
-            yield Answer(answer, *question)
+        stack = [self]
+        while stack:
+            report = stack.pop()
+            for question, answer in report.__problems:
+                yield Answer(answer, *question)
+            stack.extend(reversed(report.__children))
 
     def finalize(self):
         """Finish the report and send results to any report higher up."""
         if self.__finalized:
             raise RuntimeError('Report is finalized!')
         self.__finalized, parent = True, self.__parent
+        self.total = self.right + self.wrong
         if parent is not None:
-            parent.__right += self.__right
-            parent.__wrong += self.__wrong
-            parent.__problems.extend(self.__problems)
-
-    @property
-    def level(self):
-        """Read-only level property (level in the testbank structure)."""
-        return self.__level
-
-    @property
-    def right(self):
-        """Read-only right property (how many answers were correct)."""
-        if not self.__finalized:
-            raise RuntimeError('Report is not finalized!')
-        return self.__right
-
-    @property
-    def wrong(self):
-        """Read-only wrong property (how many answers were incorrect)."""
-        if not self.__finalized:
-            raise RuntimeError('Report is not finalized!')
-        return self.__wrong
-
-    @property
-    def total(self):
-        """Read-only total property (how many answers have been given)."""
-        if not self.__finalized:
-            raise RuntimeError('Report is not finalized!')
-        return self.__right + self.__wrong
-
-    @property
-    def final(self):
-        """Read-only final property (flag stating if report is top-level)."""
-        return self.__parent is None
+            parent.right += self.right
+            parent.wrong += self.wrong
+            parent.__children.append(self)
 
 
 class Question:
@@ -191,8 +187,7 @@ class Question:
         '__question',
         '__choices',
         '__right',
-        '__answered',
-        '__q_and_a'
+        '__answered'
     )
 
     def __init__(self, report, category, question, choices, right):
@@ -203,7 +198,6 @@ class Question:
         self.__choices = choices
         self.__right = right
         self.__answered = False
-        self.__q_and_a = quizcore.Record(category, question, choices, right)
 
     @property
     def category(self):
@@ -226,36 +220,26 @@ class Question:
             raise RuntimeError('Question has already been answered!')
         if isinstance(index_or_string, int):
             index_or_string = self.__choices[index_or_string]
-        if index_or_string == self.__right:
+        right = self.__right
+        if index_or_string is right or index_or_string == right:
             self.__report.right_answer()
         else:
             self.__report.wrong_answer()
-            self.__report.review(self.__q_and_a, index_or_string)
+            record = quizcore.Record(
+                self.__category, self.__question, self.__choices, right
+            )
+            self.__report.review(record, index_or_string)
         self.__answered = True
 
-    @property
-    def _right_answer(self):
-        """Read-only _right_answer property (private)."""
-        return self.__right
-
 
 class Answer(Question):
     """Answer(answer, category, question, choices, right) -> Answer instance"""
 
-    __slots__ = '__answer'
+    # These slots shadow Question.answer since answers are only reviewed.
+    __slots__ = 'answer', 'right'
 
     def __init__(self, answer, category, question, choices, right):
         """Initialize the Answer instance like it was a Question."""
         super().__init__(None, category, question, choices, right)
-        self.__answer = answer
-
-    # noinspection PyMethodOverriding
-    @property
-    def answer(self):
-        """Read-only answer property (has the answer that was given)."""
-        return self.__answer
-
-    @property
-    def right(self):
-        """Read-only right property (says what the correct answer is)."""
-        return self._right_answer
+        self.answer = answer
+        self.right = right
@@ -21,82 +21,73 @@ __all__ = [
     'Answer'
 ]
 
-import abc
-import xml.sax
-import xml.sax.handler
+import sys
+import xml.etree.ElementTree
 
 
-class BankParser(xml.sax.handler.ContentHandler):
+class BankParser:
     """BankParser() -> BankParser instance"""
 
+    NAMESPACE = '{QuizMe}'
+
     @classmethod
     def parse(cls, filename):
         """Parse the XML specified by filename and return the root node."""
         parser = cls()
-        xml.sax.parse(filename, parser)
+        for event, element in xml.etree.ElementTree.iterparse(
+                filename, ('start', 'end')
+        ):
+            # Only the testbank's own namespace is dropped from tags.
+            name = element.tag
+            if name.startswith(cls.NAMESPACE):
+                name = name[len(cls.NAMESPACE):]
+            if event == 'start':
+                parser.startElement(name, element.attrib)
+            else:
+                # Only text before the first child belongs to this node.
+                if element.text:
+                    parser.characters(element.text)
+                parser.endElement(name)
+                element.clear()
         return parser.root_node
 
     def __init__(self):
         """Initialize the BankParser instance with an element context list."""
-        super().__init__()
         self.context = []
         self.root_node = None
+        self.top_add_text = None
 
     def startElement(self, name, attributes):
         """Record when elements are introduced in the XML document."""
-        if name == 'testbank':
-            # Validate
+        try:
+            kind, parent, attr_name = _ELEMENTS[name]
+        except KeyError:
+            # Something is wrong with this document.
+            raise ValueError(name) from None
+        # Validate
+        if parent is None:
             if self.context:
                 raise RuntimeError('Context should be empty!')
-            # Specific
-            self.context.append(TestBank(attributes.getValue('name')))
-        elif name == 'chapter':
-            # Validate
-            if not isinstance(self.context[-1], TestBank):
-                raise RuntimeError('Chapter should be in context of testbank!')
-            # Specific
-            self.context.append(Chapter(attributes.getValue('name')))
-        elif name == 'section':
-            # Validate
-            if not isinstance(self.context[-1], Chapter):
-                raise RuntimeError('Section should be in context of chapter!')
-            # Specific
-            self.context.append(Section(attributes.getValue('name')))
-        elif name == 'category':
-            # Validate
-            if not isinstance(self.context[-1], Section):
-                raise RuntimeError('Category should be in context of section!')
-            # Specific
-            self.context.append(Category(attributes.getValue('type')))
-        elif name == 'fact':
-            # Validate
-            if not isinstance(self.context[-1], Category):
-                raise RuntimeError('Fact should be in context of category!')
-            # Specific
-            self.context.append(Fact(
-                attributes.getValue('type')
-                if self.context[-1].attr == 'multiple_choice' else
-                None
-            ))
-        elif name == 'question':
-            # Validate
-            if not isinstance(self.context[-1], Fact):
-                raise RuntimeError('Question should be in context of fact!')
-            # Specific
-            self.context.append(Question())
-        elif name == 'answer':
-            # Validate
-            if not isinstance(self.context[-1], Fact):
-                raise RuntimeError('Answer should be in context of fact!')
-            # Specific
-            self.context.append(Answer())
+        elif not isinstance(self.context[-1], parent):
+            raise RuntimeError(
+                f'{kind.__name__} should be in context of '
+                f'{parent.__name__.lower()}!'
+            )
+        # Specific
+        if attr_name is None:
+            node = kind()
+        elif kind is Fact and self.context[-1].attr != 'multiple_choice':
+            # Only facts in multiple choice categories are given a type.
+            node = kind(None)
         else:
-            # Something is wrong with this document.
-            raise ValueError(name)
+            # Attribute values repeat often, so keep one copy of each.
+            node = kind(sys.intern(attributes[attr_name]))
+        self.context.append(node)
+        self.top_add_text = node.add_text
 
     def characters(self, content):
         """Add character data to the node at the top of the context."""
-        self.context[-1].add_text(content)
+        self.top_add_text(content)
 
     def endElement(self, name):
         """Record an element's end and update the document's node tree."""
@@ -104,21 +95,22 @@ class BankParser(xml.sax.handler.ContentHandler):
         if name == 'testbank':
             self.root_node = node
         else:
-            self.context[-1].add_child(node)
+            parent = self.context[-1]
+            parent.add_child(node)
+            self.top_add_text = parent.add_text
 
 
-class _Node(metaclass=abc.ABCMeta):
-    """Abstract Base Class"""
+class _Node:
+    """_Node(attr=None) -> _Node instance"""
 
-    __slots__ = 'attr', 'text', 'children'
+    __slots__ = 'attr', '__text', 'children'
 
     ATTR_NAME = None
 
-    @abc.abstractmethod
-    def __init__(self, attr):
+    def __init__(self, attr=None):
         """Initialize the _Node instance with whatever attribute it has."""
         self.attr = attr
-        self.text = ''
+        self.__text = []
         self.children = []
 
     def __repr__(self):
@@ -127,16 +119,19 @@ class _Node(metaclass=abc.ABCMeta):
         attr = '' if self.attr is None else f' {self.ATTR_NAME}="{self.attr}"'
         cache = [f'<{name}{attr}>']
         for child in self.children:
-            lines = repr(child).split('\n')
-            lines = map(lambda line: '    ' + line, lines)
-            cache.append('\n' + '\n'.join(lines))
+            cache.append('\n    ' + repr(child).replace('\n', '\n    '))
         cache.append(self.text if self.ATTR_NAME is None else '\n')
         cache.append(f'</{name}>')
         return ''.join(cache)
 
+    @property
+    def text(self):
+        """Read-only text property (character data that has been added)."""
+        return ''.join(self.__text)
+
     def add_text(self, content):
         """Add character data to the node's text content."""
-        self.text += content
+        self.__text.append(content)
 
     def add_child(self, node):
         """Add a child to this node's list of children."""
@@ -150,10 +145,6 @@ class TestBank(_Node):
 
     ATTR_NAME = 'name'
 
-    def __init__(self, attr):
-        """Allow this node type to be instantiated."""
-        super().__init__(attr)
-
 
 class Chapter(_Node):
     """Chapter(attr) -> Chapter instance"""
@@ -162,10 +153,6 @@ class Chapter(_Node):
 
     ATTR_NAME = 'name'
 
-    def __init__(self, attr):
-        """Allow this node type to be instantiated."""
-        super().__init__(attr)
-
 
 class Section(_Node):
     """Section(attr) -> Section instance"""
@@ -174,10 +161,6 @@ class Section(_Node):
 
     ATTR_NAME = 'name'
 
-    def __init__(self, attr):
-        """Allow this node type to be instantiated."""
-        super().__init__(attr)
-
 
 class Category(_Node):
     """Category(attr) -> Category instance"""
@@ -185,10 +168,11 @@ class Category(_Node):
     __slots__ = ()
 
     ATTR_NAME = 'type'
+    TYPES = frozenset({'matching', 'multiple_choice', 'true_or_false'})
 
     def __init__(self, attr):
         """Allow this node type to be instantiated and validate."""
-        if attr not in {'matching', 'multiple_choice', 'true_or_false'}:
+        if attr not in self.TYPES:
             raise RuntimeError('Type of category not recognized!')
         super().__init__(attr)
 
@@ -200,26 +184,26 @@ class Fact(_Node):
 
     ATTR_NAME = 'type'
 
-    def __init__(self, attr):
-        """Allow this node type to be instantiated."""
-        super().__init__(attr)
-
 
 class Question(_Node):
     """Question() -> Question instance"""
 
     __slots__ = ()
 
-    def __init__(self):
-        """Allow this node type to be instantiated."""
-        super().__init__(None)
-
 
 class Answer(_Node):
     """Answer() -> Answer instance"""
 
     __slots__ = ()
 
-    def __init__(self):
-        """Allow this node type to be instantiated."""
-        super().__init__(None)
+
+# Map each element's tag to its node type, parent type, and attribute name.
+_ELEMENTS = dict(
+    testbank=(TestBank, None, 'name'),
+    chapter=(Chapter, TestBank, 'name'),
+    section=(Section, Chapter, 'name'),
+    category=(Category, Section, 'type'),
+    fact=(Fact, Category, 'type'),
+    question=(Question, Fact, None),
+    answer=(Answer, Fact, None)
+)